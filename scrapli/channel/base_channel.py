@@ -1,24 +1,95 @@
 """scrapli.channel.base_channel"""
 import re
+import time
 from dataclasses import dataclass
-from datetime import datetime
 from functools import lru_cache
 from io import SEEK_END, BytesIO
-from typing import BinaryIO, List, Optional, Pattern, Tuple, Union
+from logging import DEBUG
+from string import ascii_lowercase, ascii_uppercase, whitespace
+from typing import BinaryIO, Dict, List, Optional, Pattern, Tuple, Union
 
 from scrapli.exceptions import ScrapliAuthenticationFailed, ScrapliTypeError, ScrapliValueError
 from scrapli.logging import get_instance_logger
 from scrapli.transport.base import AsyncTransport, Transport
 
-ANSI_ESCAPE_PATTERN = re.compile(
-    rb"[\x1B\x9B]"
+# nothing ever looks at the groups of an ansi match (they are only ever stripped), so all groups
+# are non-capturing -- this saves the regex engine from recording spans for every sequence
+ANSI_ESCAPE_SEQUENCE = (
     rb"[\[\]()#;?]*"
-    rb"("
-    rb"(([a-zA-Z0-9]*(;[a-zA-Z\d]*)*)?\x07)"
+    rb"(?:"
+    rb"[a-zA-Z0-9]*(?:;[a-zA-Z\d]*)*\x07"
     rb"|"
-    rb"((\d{1,4}(;\d{0,4})*)?[\dA-PRZcf-ntqry=><~])"
+    rb"(?:\d{1,4}(?:;\d{0,4})*)?[\dA-PRZcf-ntqry=><~]"
     rb")"
 )
+ANSI_ESCAPE_PATTERN = re.compile(rb"[\x1B\x9B]" + ANSI_ESCAPE_SEQUENCE)
+# same sequences as above but only introduced by a literal ESC -- a literal prefix lets the regex
+# engine jump straight from one ESC to the next (copying the clean bytes between them in bulk)
+# instead of testing a character class at every single position of the buffer
+ANSI_ESC_ESCAPE_PATTERN = re.compile(rb"\x1B" + ANSI_ESCAPE_SEQUENCE)
+
+# translation table/deletechars used to squish channel output for comparison with channel input --
+# lowers ascii letters and drops backspaces and whitespace in a single pass over the bytes
+CHANNEL_INPUT_TRANSLATION = bytes.maketrans(ascii_uppercase.encode(), ascii_lowercase.encode())
+CHANNEL_INPUT_DELETECHARS = b"\x08" + whitespace.encode()
+
+# patterns used to pull additional detail out of ssh error messages in `_ssh_message_handler`
+SSH_OFFER_PATTERN = re.compile(pattern=rb"their offer: ([a-z0-9\-,]*)", flags=re.M | re.I)
+SSH_BAD_CONFIGURATION_PATTERN = re.compile(
+    pattern=rb"bad configuration option: ([a-z0-9\+\=,]*)", flags=re.M | re.I
+)
+# ssh error messages checked (in order, first hit wins) by `_ssh_message_handler` -- each entry is
+# the lowered substring(s) to look for, the message to raise, and optionally a pattern/label used to
+# append the detail (offered algorithms, bad options) captured from the output to the message
+SSH_ERROR_MESSAGES: Tuple[Tuple[Tuple[bytes, ...], str, Optional[Pattern[bytes]], str], ...] = (
+    ((b"host key verification failed",), "Host key verification failed", None, ""),
+    (
+        (b"operation timed out", b"connection timed out"),
+        "Timed out connecting to host",
+        None,
+        "",
+    ),
+    ((b"no route to host",), "No route to host", None, ""),
+    (
+        (b"no matching host key",),
+        "No matching host key type found for host",
+        SSH_OFFER_PATTERN,
+        "their offer",
+    ),
+    (
+        (b"no matching key exchange",),
+        "No matching key exchange found for host",
+        SSH_OFFER_PATTERN,
+        "their offer",
+    ),
+    (
+        (b"no matching cipher",),
+        "No matching cipher found for host",
+        SSH_OFFER_PATTERN,
+        "their offer",
+    ),
+    (
+        (b"bad configuration",),
+        "Bad SSH configuration option(s) for host",
+        SSH_BAD_CONFIGURATION_PATTERN,
+        "bad option(s)",
+    ),
+    (
+        (b"warning: unprotected private key file!",),
+        "Permissions for private key are too open, authentication failed!",
+        None,
+        "",
+    ),
+    ((b"could not resolve hostname",), "Could not resolve address for host", None, ""),
+)
+
+# default in channel auth patterns -- also used when a driver passes an empty string for a pattern
+DEFAULT_AUTH_TELNET_LOGIN_PATTERN = r"^(.*username:)|(.*login:)\s?$"
+DEFAULT_AUTH_PASSWORD_PATTERN = r"(.*@.*)?password:\s?$"
+DEFAULT_AUTH_PASSPHRASE_PATTERN = r"enter passphrase for key"
+
+# valid (lowered) channel_log_mode values and the file mode each one opens the channel log with
+CHANNEL_LOG_MODES: Dict[str, str] = {"write": "w", "append": "a"}
 
 
 @dataclass()
@@ -55,9 +126,9 @@ class BaseChannelArgs:
 
     """
 
-    auth_telnet_login_pattern: str = r"^(.*username:)|(.*login:)\s?$"
-    auth_password_pattern: str = r"(.*@.*)?password:\s?$"
-    auth_passphrase_pattern: str = r"enter passphrase for key"
+    auth_telnet_login_pattern: str = DEFAULT_AUTH_TELNET_LOGIN_PATTERN
+    auth_password_pattern: str = DEFAULT_AUTH_PASSWORD_PATTERN
+    auth_passphrase_pattern: str = DEFAULT_AUTH_PASSPHRASE_PATTERN
     comms_prompt_pattern: str = r"^[a-z0-9.\-@()/:]{1,32}[#>$]$"
     comms_return_char: str = "\n"
     comms_prompt_search_depth: int = 1000
@@ -80,28 +151,22 @@ class BaseChannelArgs:
             ScrapliValueError: if invalid channel_log_mode provided
 
         """
-        if self.auth_telnet_login_pattern == "":
-            self.auth_telnet_login_pattern = r"^(.*username:)|(.*login:)\s?$"
-
-        if self.auth_password_pattern == "":
-            self.auth_password_pattern = r"(.*@.*)?password:\s?$"
-
-        if self.auth_passphrase_pattern == "":
-            self.auth_passphrase_pattern = r"enter passphrase for key"
+        self.auth_telnet_login_pattern = (
+            self.auth_telnet_login_pattern or DEFAULT_AUTH_TELNET_LOGIN_PATTERN
+        )
+        self.auth_password_pattern = self.auth_password_pattern or DEFAULT_AUTH_PASSWORD_PATTERN
+        self.auth_passphrase_pattern = (
+            self.auth_passphrase_pattern or DEFAULT_AUTH_PASSPHRASE_PATTERN
+        )
 
-        if self.channel_log_mode.lower() not in (
-            "write",
-            "append",
-        ):
+        channel_log_mode = CHANNEL_LOG_MODES.get(self.channel_log_mode.lower())
+        if channel_log_mode is None:
             raise ScrapliValueError(
                 f"provided channel_log_mode '{self.channel_log_mode}' is not valid, mode must be "
                 f"one of: 'write', 'append'"
             )
 
-        if self.channel_log_mode.lower() == "write":
-            self.channel_log_mode = "w"
-        else:
-            self.channel_log_mode = "a"
+        self.channel_log_mode = channel_log_mode
 
 
 class BaseChannel:
@@ -136,6 +201,13 @@ class BaseChannel:
 
         self.channel_log: Optional[BinaryIO] = None
 
+        # compiled auth patterns keyed by args attribute name, along w/ the string they were
+        # compiled from so that any change to the channel args is picked up on the next access
+        self._auth_patterns: Dict[str, Tuple[str, Pattern[bytes]]] = {}
+
+        self._comms_return_char = ""
+        self._comms_return_char_bytes = b""
+
     @property
     def auth_telnet_login_pattern(self) -> Pattern[bytes]:
         """
@@ -151,9 +223,7 @@ class BaseChannel:
             N/A
 
         """
-        return re.compile(
-            self._base_channel_args.auth_telnet_login_pattern.encode(), flags=re.I | re.M
-        )
+        return self._get_auth_pattern(attribute="auth_telnet_login_pattern")
 
     @auth_telnet_login_pattern.setter
     def auth_telnet_login_pattern(self, value: str) -> None:
@@ -171,12 +241,10 @@ class BaseChannel:
             ScrapliTypeError: if value is not of type str
 
         """
-        self.logger.debug(f"setting 'auth_telnet_login_pattern' value to '{value}'")
-
         if not isinstance(value, str):
             raise ScrapliTypeError
 
-        self._base_channel_args.auth_telnet_login_pattern = value
+        self._set_auth_pattern(attribute="auth_telnet_login_pattern", value=value)
 
     @property
     def auth_password_pattern(self) -> Pattern[bytes]:
@@ -193,7 +261,7 @@ class BaseChannel:
             N/A
 
         """
-        return re.compile(self._base_channel_args.auth_password_pattern.encode(), flags=re.I | re.M)
+        return self._get_auth_pattern(attribute="auth_password_pattern")
 
     @auth_password_pattern.setter
     def auth_password_pattern(self, value: str) -> None:
@@ -211,12 +279,10 @@ class BaseChannel:
             ScrapliTypeError: if value is not of type str
 
         """
-        self.logger.debug(f"setting 'auth_password_pattern' value to '{value}'")
-
         if not isinstance(value, str):
             raise ScrapliTypeError
 
-        self._base_channel_args.auth_password_pattern = value
+        self._set_auth_pattern(attribute="auth_password_pattern", value=value)
 
     @property
     def auth_passphrase_pattern(self) -> Pattern[bytes]:
@@ -233,9 +299,7 @@ class BaseChannel:
             N/A
 
         """
-        return re.compile(
-            self._base_channel_args.auth_passphrase_pattern.encode(), flags=re.I | re.M
-        )
+        return self._get_auth_pattern(attribute="auth_passphrase_pattern")
 
     @auth_passphrase_pattern.setter
     def auth_passphrase_pattern(self, value: str) -> None:
@@ -253,12 +317,54 @@ class BaseChannel:
             ScrapliTypeError: if value is not of type str
 
         """
-        self.logger.debug(f"setting '_auth_passphrase_pattern' value to '{value}'")
+        if not isinstance(value, str):
+            raise ScrapliTypeError
+
+        self._set_auth_pattern(attribute="auth_passphrase_pattern", value=value)
+
+    @property
+    def comms_prompt_pattern(self) -> Pattern[bytes]:
+        """
+        Getter for `comms_prompt_pattern` attribute
+
+        The compiled pattern is served from the `_get_prompt_pattern` lru cache, so repeated access
+        in the read loops does not re-compile anything, while any change to the underlying
+        `_base_channel_args.comms_prompt_pattern` string (i.e. from the driver) is still "noticed".
+
+        Args:
+            N/A
+
+        Returns:
+            Pattern: compiled pattern of the set comms_prompt_pattern value
+
+        Raises:
+            N/A
+
+        """
+        return self._get_prompt_pattern(class_pattern=self._base_channel_args.comms_prompt_pattern)
+
+    @comms_prompt_pattern.setter
+    def comms_prompt_pattern(self, value: str) -> None:
+        """
+        Setter for `comms_prompt_pattern` attribute
+
+        Args:
+            value: str value for comms_prompt_pattern; this value will be compiled withe re.I and
+                re.M flags when the getter is called.
+
+        Returns:
+            None
+
+        Raises:
+            ScrapliTypeError: if value is not of type str
+
+        """
+        self.logger.debug(f"setting 'comms_prompt_pattern' value to '{value}'")
 
         if not isinstance(value, str):
             raise ScrapliTypeError
 
-        self._base_channel_args.auth_passphrase_pattern = value
+        self._base_channel_args.comms_prompt_pattern = value
 
     def open(self) -> None:
         """
@@ -341,6 +447,106 @@ class BaseChannel:
 
         return search_buf
 
+    def _get_auth_pattern(self, attribute: str) -> Pattern[bytes]:
+        """
+        Return the compiled auth pattern for the given channel args attribute
+
+        The compiled pattern is cached on the channel and only looked up again if the string in the
+        channel args is no longer the one it was compiled from, so the auth pattern getters never
+        hand back a stale pattern regardless of how the channel args were updated.
+
+        Args:
+            attribute: name of the auth pattern attribute of the channel args
+
+        Returns:
+            Pattern: compiled auth pattern
+
+        Raises:
+            N/A
+
+        """
+        pattern = getattr(self._base_channel_args, attribute)
+
+        cached_pattern = self._auth_patterns.get(attribute)
+        if cached_pattern is None or cached_pattern[0] is not pattern:
+            cached_pattern = (pattern, self._get_prompt_pattern(class_pattern=pattern))
+            self._auth_patterns[attribute] = cached_pattern
+
+        return cached_pattern[1]
+
+    def _set_auth_pattern(self, attribute: str, value: str) -> None:
+        """
+        Set an (already validated) auth pattern on the channel args
+
+        Args:
+            attribute: name of the auth pattern attribute of the channel args
+            value: str value for the auth pattern
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self.logger.debug(f"setting '{attribute}' value to '{value}'")
+
+        setattr(self._base_channel_args, attribute, value)
+
+    def _get_prompt_search_start(self, buf: Union[bytes, bytearray]) -> int:
+        """
+        Return the position to start searching for the prompt from in a read buffer
+
+        Like `_process_read_buf`, this only considers the last search depth worth of the buffer and
+        skips past the first (likely partial) line in that window, so that prompt patterns -- even
+        ones that are not anchored -- can not match a cut off line. If there is nothing after that
+        first line the whole window is searched. Returning a position rather than a slice lets the
+        caller search the buffer without copying the tail out of it.
+
+        Args:
+            buf: bytes read from the channel so far
+
+        Returns:
+            int: position in buf to start the prompt search from
+
+        Raises:
+            N/A
+
+        """
+        search_start = len(buf) - self._base_channel_args.comms_prompt_search_depth
+        if search_start <= 0:
+            return 0
+
+        newline_index = buf.find(b"\n", search_start)
+        if newline_index == -1 or newline_index + 1 == len(buf):
+            # didn't find a newline or nothing after it
+            return search_start
+
+        return newline_index + 1
+
+    def _get_comms_return_char_bytes(self) -> bytes:
+        """
+        Return the encoded comms_return_char
+
+        The encoded value is cached and only re-encoded if the `comms_return_char` of the channel
+        args has changed since the last call -- the driver (or users) may update it at any time.
+
+        Args:
+            N/A
+
+        Returns:
+            bytes: encoded comms_return_char
+
+        Raises:
+            N/A
+
+        """
+        comms_return_char = self._base_channel_args.comms_return_char
+        if comms_return_char is not self._comms_return_char:
+            self._comms_return_char = comms_return_char
+            self._comms_return_char_bytes = comms_return_char.encode()
+        return self._comms_return_char_bytes
+
     def write(self, channel_input: str, redacted: bool = False) -> None:
         """
         Write input to the underlying Transport session
@@ -356,8 +562,9 @@ class BaseChannel:
             N/A
 
         """
-        log_output = "REDACTED" if redacted else repr(channel_input)
-        self.logger.debug(f"write: {log_output}")
+        if self.logger.isEnabledFor(DEBUG):
+            log_output = "REDACTED" if redacted else repr(channel_input)
+            self.logger.debug(f"write: {log_output}")
 
         self.transport.write(channel_input=channel_input.encode())
 
@@ -375,7 +582,10 @@ class BaseChannel:
             N/A
 
         """
-        self.write(channel_input=self._base_channel_args.comms_return_char)
+        if self.logger.isEnabledFor(DEBUG):
+            self.logger.debug(f"write: {self._base_channel_args.comms_return_char!r}")
+
+        self.transport.write(channel_input=self._get_comms_return_char_bytes())
 
     @staticmethod
     def _join_and_compile(channel_outputs: Optional[List[bytes]]) -> Pattern[bytes]:
@@ -394,14 +604,16 @@ class BaseChannel:
         """
         regex_channel_outputs = b""
         if channel_outputs:
+            # non-capturing groups -- callers only care if *any* output matched, so there is no
+            # reason to have the regex engine track the span of each alternative
             regex_channel_outputs = b"|".join(
-                [b"(" + channel_output + b")" for channel_output in channel_outputs]
+                [b"(?:" + channel_output + b")" for channel_output in channel_outputs]
             )
         regex_channel_outputs_pattern = re.compile(pattern=regex_channel_outputs, flags=re.I | re.M)
 
         return regex_channel_outputs_pattern
 
-    def _ssh_message_handler(self, output: bytes) -> None:  # noqa: C901
+    def _ssh_message_handler(self, output: bytes) -> None:
         """
         Parse EOF messages from _pty_authenticate and create log/stack exception message
 
@@ -416,68 +628,40 @@ class BaseChannel:
 
         """
         msg = ""
-        if b"host key verification failed" in output.lower():
-            msg = "Host key verification failed"
-        elif b"operation timed out" in output.lower() or b"connection timed out" in output.lower():
-            msg = "Timed out connecting to host"
-        elif b"no route to host" in output.lower():
-            msg = "No route to host"
-        elif b"no matching host key" in output.lower():
-            msg = "No matching host key type found for host"
-            key_exchange_pattern = re.compile(
-                pattern=rb"their offer: ([a-z0-9\-,]*)", flags=re.M | re.I
-            )
-            offered_key_exchanges_match = re.search(pattern=key_exchange_pattern, string=output)
-            if offered_key_exchanges_match:
-                offered_key_exchanges = offered_key_exchanges_match.group(1).decode()
-                msg += f", their offer: {offered_key_exchanges}"
-        elif b"no matching key exchange" in output.lower():
-            msg = "No matching key exchange found for host"
-            key_exchange_pattern = re.compile(
-                pattern=rb"their offer: ([a-z0-9\-,]*)", flags=re.M | re.I
-            )
-            offered_key_exchanges_match = re.search(pattern=key_exchange_pattern, string=output)
-            if offered_key_exchanges_match:
-                offered_key_exchanges = offered_key_exchanges_match.group(1).decode()
-                msg += f", their offer: {offered_key_exchanges}"
-        elif b"no matching cipher" in output.lower():
-            msg = "No matching cipher found for host"
-            ciphers_pattern = re.compile(pattern=rb"their offer: ([a-z0-9\-,]*)", flags=re.M | re.I)
-            offered_ciphers_match = re.search(pattern=ciphers_pattern, string=output)
-            if offered_ciphers_match:
-                offered_ciphers = offered_ciphers_match.group(1).decode()
-                msg += f", their offer: {offered_ciphers}"
-        elif b"bad configuration" in output.lower():
-            msg = "Bad SSH configuration option(s) for host"
-            configuration_pattern = re.compile(
-                pattern=rb"bad configuration option: ([a-z0-9\+\=,]*)", flags=re.M | re.I
-            )
-            configuration_issue_match = re.search(pattern=configuration_pattern, string=output)
-            if configuration_issue_match:
-                configuration_issues = configuration_issue_match.group(1).decode()
-                msg += f", bad option(s): {configuration_issues}"
-        elif b"WARNING: UNPROTECTED PRIVATE KEY FILE!" in output:
-            msg = "Permissions for private key are too open, authentication failed!"
-        elif b"could not resolve hostname" in output.lower():
-            msg = "Could not resolve address for host"
-        elif b"permission denied" in output.lower():
-            msg = str(output)
+        output_lower = output.lower()
+        for needles, message, detail_pattern, detail_label in SSH_ERROR_MESSAGES:
+            if not any(needle in output_lower for needle in needles):
+                continue
+            msg = message
+            if detail_pattern is not None:
+                detail_match = detail_pattern.search(output)
+                if detail_match:
+                    msg += f", {detail_label}: {detail_match.group(1).decode()}"
+            break
+        else:
+            if b"permission denied" in output_lower:
+                msg = str(output)
         if msg:
             self.logger.critical(msg)
             raise ScrapliAuthenticationFailed(msg)
 
     @staticmethod
-    @lru_cache()
+    @lru_cache(maxsize=1024)
     def _get_prompt_pattern(class_pattern: str, pattern: Optional[str] = None) -> Pattern[bytes]:
         """
         Return compiled prompt pattern
 
-        Given a potential prompt and the Channel class' prompt, return compiled prompt pattern
+        Given a potential prompt and the Channel class' prompt, return compiled prompt pattern. As
+        this is cached at the class level, compiled patterns are shared by all channel instances.
+        The auth pattern getters also compile through this cache, as they use the same flags. The
+        cache is sized generously as every (class pattern, explicit prompt) pair takes up a slot,
+        and a process driving many platforms/explicit prompts should not be left recompiling them.
 
         Args:
-            class_pattern: comms_prompt_pattern from the class itself; must be passed so that the
-                arguments are recognized in lru cache; this way if a user changes the pattern during
-                normal scrapli operations the lru cache can "notice" the pattern changed!
+            class_pattern: prompt-like pattern string to compile when no pattern is provided -- the
+                channel's comms_prompt_pattern or one of its auth patterns; must be passed so that
+                the arguments are recognized in lru cache; this way if a user changes the pattern
+                during normal scrapli operations the lru cache can "notice" the pattern changed!
             pattern: optional regex pattern to compile, if not provided we use the class' pattern
 
         Returns:
@@ -495,6 +679,43 @@ class BaseChannel:
             return re.compile(bytes_pattern, flags=re.M | re.I)
         return re.compile(re.escape(bytes_pattern))
 
+    def _pre_read_until_explicit_prompt(
+        self, prompts: List[str]
+    ) -> Tuple[List[bytes], List[Pattern[bytes]]]:
+        """
+        Handle pre "read_until_explicit_prompt" tasks for parity between sync and async versions.
+
+        Prompts that are not "^...$" anchored patterns are compiled as escaped literals by
+        `_get_prompt_pattern` anyway, so rather than running the regex engine over the search
+        buffer for those we return them as plain bytes to check for with a simple substring check.
+
+        Args:
+            prompts: list of prompt patterns to look for
+
+        Returns:
+            tuple: tuple of literal prompts and compiled prompt patterns
+
+        Raises:
+            N/A
+
+        """
+        search_literals = []
+        search_patterns = []
+
+        for prompt in prompts:
+            bytes_prompt = prompt.encode()
+            if bytes_prompt and not (bytes_prompt.startswith(b"^") and bytes_prompt.endswith(b"$")):
+                search_literals.append(bytes_prompt)
+                continue
+
+            search_patterns.append(
+                self._get_prompt_pattern(
+                    class_pattern=self._base_channel_args.comms_prompt_pattern, pattern=prompt
+                )
+            )
+
+        return search_literals, search_patterns
+
     def _pre_channel_authenticate_ssh(
         self,
     ) -> Tuple[Pattern[bytes], Pattern[bytes], Pattern[bytes]]:
@@ -511,11 +732,7 @@ class BaseChannel:
             N/A
 
         """
-        prompt_pattern = self._get_prompt_pattern(
-            class_pattern=self._base_channel_args.comms_prompt_pattern
-        )
-
-        return self.auth_password_pattern, self.auth_passphrase_pattern, prompt_pattern
+        return self.auth_password_pattern, self.auth_passphrase_pattern, self.comms_prompt_pattern
 
     def _pre_channel_authenticate_telnet(
         self,
@@ -533,21 +750,17 @@ class BaseChannel:
             N/A
 
         """
-        prompt_pattern = self._get_prompt_pattern(
-            class_pattern=self._base_channel_args.comms_prompt_pattern
-        )
-
         # capture the start time of the authentication event; we also set a "return_interval" which
         # is 1/10 the timout_ops value, we will send a return character at roughly this interval if
         # there is no output on the channel. we do this because sometimes telnet needs a kick to get
         # it to prompt for auth -- particularity when connecting to terminal server/console port
-        auth_start_time = datetime.now().timestamp()
+        auth_start_time = time.monotonic()
         return_interval = self._base_channel_args.timeout_ops / 10
 
         return (
             self.auth_telnet_login_pattern,
             self.auth_password_pattern,
-            prompt_pattern,
+            self.comms_prompt_pattern,
             auth_start_time,
             return_interval,
         )
@@ -569,15 +782,24 @@ class BaseChannel:
             N/A
 
         """
+        if not buf:
+            # nothing to process or strip a prompt from -- i.e. "eager" inputs which never read
+            # until the prompt, no need to go splitting lines and running the prompt regex
+            return buf
+
         buf = b"\n".join([line.rstrip() for line in buf.splitlines()])
 
         if strip_prompt:
-            prompt_pattern = self._get_prompt_pattern(
-                class_pattern=self._base_channel_args.comms_prompt_pattern
-            )
-            buf = re.sub(pattern=prompt_pattern, repl=b"", string=buf)
-
-        buf = buf.lstrip(self._base_channel_args.comms_return_char.encode()).rstrip()
+            prompt_pattern = self.comms_prompt_pattern
+            prompt_match = prompt_pattern.search(buf)
+            if prompt_match and prompt_match.end() == len(buf):
+                # the first match is at the very end of the output, so it is the *only* match --
+                # just slice it off rather than having the regex engine build a whole new buffer
+                buf = buf[: prompt_match.start()]
+            elif prompt_match:
+                buf = prompt_pattern.sub(b"", buf)
+
+        buf = buf.lstrip(self._get_comms_return_char_bytes()).rstrip()
         return buf
 
     @staticmethod
@@ -595,8 +817,34 @@ class BaseChannel:
             N/A
 
         """
-        buf = re.sub(pattern=ANSI_ESCAPE_PATTERN, repl=b"", string=buf)
-        return buf
+        if b"\x9b" in buf:
+            # 8-bit CSI introducer present, need the (slower) pattern that handles both introducers
+            return ANSI_ESCAPE_PATTERN.sub(b"", buf)
+        if b"\x1b" not in buf:
+            # no introducer of either flavor, nothing for the regex engine to do
+            return buf
+
+        return ANSI_ESC_ESCAPE_PATTERN.sub(b"", buf)
+
+    @staticmethod
+    def _squish_channel_input(buf: bytes) -> bytes:
+        """
+        Lower and remove all backspace and whitespace chars from channel input/output
+
+        Backspaces are a particular problem w/ junos, and devices may add spaces/line breaks when
+        echoing long inputs, so this is used to compare inputs to what was read from the channel.
+
+        Args:
+            buf: bytes to squish
+
+        Returns:
+            bytes: lowered bytes with all backspace/whitespace chars removed
+
+        Raises:
+            N/A
+
+        """
+        return buf.translate(CHANNEL_INPUT_TRANSLATION, CHANNEL_INPUT_DELETECHARS)
 
     @staticmethod
     def _pre_send_input(channel_input: str) -> None:
@@ -1,9 +1,8 @@
 """scrapli.channel.sync_channel"""
-import re
 import time
 from contextlib import contextmanager, suppress
-from datetime import datetime
 from io import BytesIO
+from logging import DEBUG
 from threading import Lock
 from typing import Iterator, List, Optional, Tuple
 
@@ -69,12 +68,16 @@ class Channel(BaseChannel):
         buf = self.transport.read()
         buf = buf.replace(b"\r", b"")
 
-        self.logger.debug(f"read: {buf!r}")
+        # repr of a (potentially large) read is not cheap, so skip building it if debug is off
+        if self.logger.isEnabledFor(DEBUG):
+            self.logger.debug(f"read: {buf!r}")
 
         if self.channel_log:
             self.channel_log.write(buf)
 
-        if b"\x1b" in buf.lower():
+        # escape is not a cased byte, so there is no need to lower (and copy) the whole chunk just
+        # to check if there is anything for the (comparatively slow) ansi regex to do
+        if b"\x1b" in buf:
             buf = self._strip_ansi(buf=buf)
 
         return buf
@@ -93,21 +96,30 @@ class Channel(BaseChannel):
             N/A
 
         """
-        buf = b""
-
         if not channel_input:
-            return buf
+            return b""
+
+        # accumulate in a bytearray so each read extends the buffer in place rather than copying
+        # the entire (immutable) bytes object every time we read a chunk
+        buf = bytearray()
+        processed_buf = bytearray()
 
         # squish all channel input words together and cast to lower to make comparison easier
-        processed_channel_input = b"".join(channel_input.lower().split())
+        processed_channel_input = self._squish_channel_input(buf=channel_input)
 
         while True:
-            buf += self.read()
+            read_buf = self.read()
+            buf += read_buf
 
-            # replace any backspace chars (particular problem w/ junos), and remove any added spaces
-            # this is just for comparison of the inputs to what was read from channel
-            if processed_channel_input in b"".join(buf.lower().replace(b"\x08", b"").split()):
-                return buf
+            # a match must end in the newly read data, so no need to search from the very start
+            search_start = max(len(processed_buf) - len(processed_channel_input), 0)
+
+            # squish the read data the same way as the input for comparison; as this is a per byte
+            # operation we only need to process the newly read data
+            processed_buf += self._squish_channel_input(buf=read_buf)
+
+            if processed_buf.find(processed_channel_input, search_start) != -1:
+                return bytes(buf)
 
     def _read_until_prompt(self, buf: bytes = b"") -> bytes:
         """
@@ -127,9 +139,7 @@ class Channel(BaseChannel):
             N/A
 
         """
-        search_pattern = self._get_prompt_pattern(
-            class_pattern=self._base_channel_args.comms_prompt_pattern
-        )
+        search_pattern = self.comms_prompt_pattern
 
         read_buf = BytesIO(buf)
 
@@ -138,10 +148,7 @@ class Channel(BaseChannel):
 
             search_buf = self._process_read_buf(read_buf=read_buf)
 
-            channel_match = re.search(
-                pattern=search_pattern,
-                string=search_buf,
-            )
+            channel_match = search_pattern.search(search_buf)
 
             if channel_match:
                 return read_buf.getvalue()
@@ -164,12 +171,7 @@ class Channel(BaseChannel):
             N/A
 
         """
-        search_patterns = [
-            self._get_prompt_pattern(
-                class_pattern=self._base_channel_args.comms_prompt_pattern, pattern=prompt
-            )
-            for prompt in prompts
-        ]
+        search_literals, search_patterns = self._pre_read_until_explicit_prompt(prompts=prompts)
 
         read_buf = BytesIO(b"")
 
@@ -178,11 +180,11 @@ class Channel(BaseChannel):
 
             search_buf = self._process_read_buf(read_buf=read_buf)
 
+            if any(search_literal in search_buf for search_literal in search_literals):
+                return read_buf.getvalue()
+
             for search_pattern in search_patterns:
-                channel_match = re.search(
-                    pattern=search_pattern,
-                    string=search_buf,
-                )
+                channel_match = search_pattern.search(search_buf)
 
                 if channel_match:
                     return read_buf.getvalue()
@@ -212,9 +214,7 @@ class Channel(BaseChannel):
             N/A
 
         """
-        search_pattern = self._get_prompt_pattern(
-            class_pattern=self._base_channel_args.comms_prompt_pattern,
-        )
+        search_pattern = self.comms_prompt_pattern
 
         if channel_outputs is None:
             channel_outputs = []
@@ -229,23 +229,26 @@ class Channel(BaseChannel):
 
         read_buf = BytesIO(buf)
 
-        start = time.time()
-        while True:
-            with suppress(ScrapliTimeout):
-                read_buf.write(self.read())
-
-            search_buf = self._process_read_buf(read_buf=read_buf)
-
-            if (time.time() - start) > read_duration:
-                break
-            if any(channel_output in search_buf for channel_output in channel_outputs):
-                break
-            if re.search(pattern=regex_channel_outputs_pattern, string=search_buf):
-                break
-            if re.search(pattern=search_pattern, string=search_buf):
-                break
-
-        _transport_args.timeout_transport = previous_timeout_transport
+        # always restore the transport timeout, even if reading raises (i.e. the outer
+        # timeout_wrapper timing out the operation) so later operations are not left with it
+        try:
+            start = time.monotonic()
+            while True:
+                with suppress(ScrapliTimeout):
+                    read_buf.write(self.read())
+
+                search_buf = self._process_read_buf(read_buf=read_buf)
+
+                if (time.monotonic() - start) > read_duration:
+                    break
+                if any(channel_output in search_buf for channel_output in channel_outputs):
+                    break
+                if regex_channel_outputs_pattern.search(search_buf):
+                    break
+                if search_pattern.search(search_buf):
+                    break
+        finally:
+            _transport_args.timeout_transport = previous_timeout_transport
 
         return read_buf.getvalue()
 
@@ -287,10 +290,7 @@ class Channel(BaseChannel):
 
                 self._ssh_message_handler(output=authenticate_buf)
 
-                if re.search(
-                    pattern=password_pattern,
-                    string=authenticate_buf,
-                ):
+                if password_pattern.search(authenticate_buf):
                     # clear the authentication buffer so we don't re-read the password prompt
                     authenticate_buf = b""
                     password_count += 1
@@ -301,10 +301,7 @@ class Channel(BaseChannel):
                     self.write(channel_input=auth_password, redacted=True)
                     self.send_return()
 
-                if re.search(
-                    pattern=passphrase_pattern,
-                    string=authenticate_buf,
-                ):
+                if passphrase_pattern.search(authenticate_buf):
                     # clear the authentication buffer so we don't re-read the passphrase prompt
                     authenticate_buf = b""
                     passphrase_count += 1
@@ -315,10 +312,7 @@ class Channel(BaseChannel):
                     self.write(channel_input=auth_private_key_passphrase, redacted=True)
                     self.send_return()
 
-                if re.search(
-                    pattern=prompt_pattern,
-                    string=authenticate_buf,
-                ):
+                if prompt_pattern.search(authenticate_buf):
                     return
 
     @timeout_wrapper
@@ -370,7 +364,7 @@ class Channel(BaseChannel):
                     continue
 
                 if not buf:
-                    current_iteration_time = datetime.now().timestamp()
+                    current_iteration_time = time.monotonic()
                     if (current_iteration_time - auth_start_time) > (
                         return_interval * return_attempts
                     ):
@@ -379,10 +373,7 @@ class Channel(BaseChannel):
 
                 authenticate_buf += buf.lower()
 
-                if re.search(
-                    pattern=username_pattern,
-                    string=authenticate_buf,
-                ):
+                if username_pattern.search(authenticate_buf):
                     # clear the authentication buffer so we don't re-read the username prompt
                     authenticate_buf = b""
                     username_count += 1
@@ -393,10 +384,7 @@ class Channel(BaseChannel):
                     self.write(channel_input=auth_username)
                     self.send_return()
 
-                if re.search(
-                    pattern=password_pattern,
-                    string=authenticate_buf,
-                ):
+                if password_pattern.search(authenticate_buf):
                     # clear the authentication buffer so we don't re-read the password prompt
                     authenticate_buf = b""
                     password_count += 1
@@ -407,10 +395,7 @@ class Channel(BaseChannel):
                     self.write(channel_input=auth_password, redacted=True)
                     self.send_return()
 
-                if re.search(
-                    pattern=prompt_pattern,
-                    string=authenticate_buf,
-                ):
+                if prompt_pattern.search(authenticate_buf):
                     return
 
     @timeout_wrapper
@@ -428,11 +413,9 @@ class Channel(BaseChannel):
             N/A
 
         """
-        buf = b""
+        buf = bytearray()
 
-        search_pattern = self._get_prompt_pattern(
-            class_pattern=self._base_channel_args.comms_prompt_pattern
-        )
+        search_pattern = self.comms_prompt_pattern
 
         with self._channel_lock():
             self.send_return()
@@ -440,10 +423,9 @@ class Channel(BaseChannel):
             while True:
                 buf += self.read()
 
-                channel_match = re.search(
-                    pattern=search_pattern,
-                    string=buf,
-                )
+                # only search the last "search depth" worth of the buffer (minus any partial first
+                # line) like the other read methods
+                channel_match = search_pattern.search(buf, self._get_prompt_search_start(buf=buf))
 
                 if channel_match:
                     current_prompt = channel_match.group(0)
@@ -624,7 +606,6 @@ class Channel(BaseChannel):
         self._pre_send_inputs_interact(interact_events=interact_events)
 
         buf = b""
-        processed_buf = b""
 
         with self._channel_lock():
             for interact_event in interact_events:
@@ -636,10 +617,9 @@ class Channel(BaseChannel):
                 if interaction_complete_patterns is not None:
                     prompts.extend(interaction_complete_patterns)
 
-                try:
-                    hidden_input = interact_event[2]
-                except IndexError:
-                    hidden_input = False
+                # the hidden flag is optional and most events are plain two element tuples, so
+                # check the length rather than raising/catching an IndexError for most events
+                hidden_input = interact_event[2] if len(interact_event) > 2 else False
 
                 _channel_input = channel_input if not hidden_input else "REDACTED"
                 self.logger.info(
@@ -654,7 +634,7 @@ class Channel(BaseChannel):
                 self.send_return()
                 buf += self._read_until_explicit_prompt(prompts=prompts)
 
-        processed_buf += self._process_output(
+        processed_buf = self._process_output(
             buf=buf,
             strip_prompt=False,
         )
@@ -7,7 +7,7 @@ import pytest
 
 from scrapli.channel.async_channel import AsyncChannel
 from scrapli.channel.base_channel import BaseChannelArgs
-from scrapli.exceptions import ScrapliAuthenticationFailed
+from scrapli.exceptions import ScrapliAuthenticationFailed, ScrapliConnectionError
 
 
 def test_channel_lock(async_transport_no_abc):
@@ -96,6 +96,19 @@ async def test_channel_read_until_input(monkeypatch, async_channel):
     assert actual_read_output == expected_read_output
 
 
+async def test_channel_read_until_input_split_reads(monkeypatch, async_channel):
+    reads = iter((b"read_data\nthis is ", b"MY\x08 in", b"put\n"))
+
+    async def _read(cls):
+        return next(reads)
+
+    monkeypatch.setattr("scrapli.transport.base.async_transport.AsyncTransport.read", _read)
+
+    actual_read_output = await async_channel._read_until_input(channel_input=b"thisismyinput")
+
+    assert actual_read_output == b"read_data\nthis is MY\x08 input\n"
+
+
 async def test_channel_read_until_input_no_input(async_channel):
     assert await async_channel._read_until_input(channel_input=b"") == b""
 
@@ -140,6 +153,21 @@ async def test_channel_read_until_explicit_prompt(monkeypatch, async_channel):
     assert actual_read_output == expected_read_output
 
 
+async def test_channel_read_until_prompt_or_time_restores_timeout(monkeypatch, async_channel):
+    async def _read(cls):
+        raise ScrapliConnectionError
+
+    monkeypatch.setattr("scrapli.transport.base.async_transport.AsyncTransport.read", _read)
+
+    transport_args = async_channel.transport._base_transport_args
+    transport_args.timeout_transport = 30
+
+    with pytest.raises(ScrapliConnectionError):
+        await async_channel._read_until_prompt_or_time(read_duration=1)
+
+    assert transport_args.timeout_transport == 30
+
+
 # TODO read until prompt/time
 
 
@@ -370,6 +398,43 @@ async def test_get_prompt(monkeypatch, async_channel):
     assert await async_channel.get_prompt() == "scrapli>"
 
 
+async def test_get_prompt_search_depth(monkeypatch, async_channel):
+    # a prompt looking line outside of the search depth should not be matched
+    reads = iter((b"oldprompt#\n" + b"x" * 2000 + b"\n", b"scrapli>"))
+
+    async def _read(cls):
+        return next(reads)
+
+    def _write(cls, channel_input):
+        pass
+
+    monkeypatch.setattr("scrapli.transport.base.async_transport.AsyncTransport.read", _read)
+    monkeypatch.setattr("scrapli.transport.base.async_transport.AsyncTransport.write", _write)
+
+    async_channel._base_channel_args.comms_prompt_pattern = r"^\w+[#>]$"
+
+    assert await async_channel.get_prompt() == "scrapli>"
+
+
+async def test_get_prompt_search_depth_unanchored(monkeypatch, async_channel):
+    # the search depth cuts the first line short, that partial line must not match an unanchored
+    # prompt pattern
+    reads = iter((b"switchname#\n" + b"z" * 995, b"\nswitchname#"))
+
+    async def _read(cls):
+        return next(reads)
+
+    def _write(cls, channel_input):
+        pass
+
+    monkeypatch.setattr("scrapli.transport.base.async_transport.AsyncTransport.read", _read)
+    monkeypatch.setattr("scrapli.transport.base.async_transport.AsyncTransport.write", _write)
+
+    async_channel._base_channel_args.comms_prompt_pattern = r"[a-z]+#"
+
+    assert await async_channel.get_prompt() == "switchname#"
+
+
 async def test_send_input(monkeypatch, async_channel):
     _read_counter = 0
 
@@ -24,11 +24,16 @@ from scrapli.exceptions import ScrapliAuthenticationFailed, ScrapliTypeError, Sc
             "auth_passphrase_pattern",
             "enter passphrase for key",
         ),
+        (
+            "comms_prompt_pattern",
+            r"^[a-z0-9.\-@()/:]{1,32}[#>$]$",
+        ),
     ),
     ids=(
         "auth_telnet_login_pattern",
         "auth_password_pattern",
         "auth_passphrase_pattern",
+        "comms_prompt_pattern",
     ),
 )
 def test_channel_auth_properties(test_data, base_channel):
@@ -47,6 +52,30 @@ def test_channel_auth_properties(test_data, base_channel):
     assert getattr(base_channel, property_name) == compiled_new_value
 
 
+def test_channel_auth_pattern_args_updated(base_channel):
+    """
+    Asserts that the cached compiled auth pattern follows updates made directly to the channel args
+    """
+    assert base_channel.auth_password_pattern == re.compile(
+        rb"(.*@.*)?password:\s?$", flags=re.I | re.M
+    )
+    base_channel._base_channel_args.auth_password_pattern = "secret:"
+    assert base_channel.auth_password_pattern == re.compile(b"secret:", flags=re.I | re.M)
+
+
+def test_channel_auth_pattern_invalid_type(base_channel):
+    with pytest.raises(ScrapliTypeError):
+        base_channel.auth_password_pattern = 1
+
+
+def test_channel_comms_prompt_pattern_args_updated(base_channel):
+    """
+    Asserts that the compiled comms prompt pattern follows updates made directly to the channel args
+    """
+    base_channel._base_channel_args.comms_prompt_pattern = "^scrapli>$"
+    assert base_channel.comms_prompt_pattern == re.compile(b"^scrapli>$", flags=re.I | re.M)
+
+
 def test_channel_log_append(fs_, base_transport_no_abc):
     fs_.create_file(
         "scrapli_channel.log",
@@ -62,6 +91,25 @@ def test_channel_log_append(fs_, base_transport_no_abc):
     assert channel_log_contents.read() == b"APPEND TO ME PLEASE!\nDOIN IT!"
 
 
+@pytest.mark.parametrize(
+    "test_data",
+    (("write", "w"), ("append", "a"), ("Append", "a")),
+    ids=("write", "append", "mixed case"),
+)
+def test_channel_args_channel_log_mode(test_data):
+    channel_log_mode, expected_mode = test_data
+    assert BaseChannelArgs(channel_log_mode=channel_log_mode).channel_log_mode == expected_mode
+
+
+def test_channel_args_empty_auth_patterns():
+    base_channel_args = BaseChannelArgs(
+        auth_telnet_login_pattern="", auth_password_pattern="", auth_passphrase_pattern=""
+    )
+    assert base_channel_args.auth_telnet_login_pattern == r"^(.*username:)|(.*login:)\s?$"
+    assert base_channel_args.auth_password_pattern == r"(.*@.*)?password:\s?$"
+    assert base_channel_args.auth_passphrase_pattern == r"enter passphrase for key"
+
+
 def test_channel_log_invalid_mode(base_transport_no_abc):
     with pytest.raises(ScrapliValueError):
         BaseChannelArgs(channel_log=True, channel_log_mode="not valid")
@@ -120,6 +168,21 @@ def test_process_read_buf(test_data, base_channel):
     assert search_buf == expected_buf
 
 
+@pytest.mark.parametrize(
+    "test_data",
+    (
+        (b"short buf\nscrapli>", 0),
+        (b"x" * 995 + b"\npartial>\nscrapli>", 996),
+        (b"x" * 1010 + b"\n", 11),
+        (b"x" * 1010, 10),
+    ),
+    ids=("within_depth", "partial_line", "nothing_after_newline", "no_newline"),
+)
+def test_get_prompt_search_start(test_data, base_channel):
+    buf, expected_search_start = test_data
+    assert base_channel._get_prompt_search_start(buf=buf) == expected_search_start
+
+
 def test_channel_write(caplog, monkeypatch, base_channel):
     caplog.set_level(logging.DEBUG, logger="scrapli.channel")
 
@@ -159,6 +222,19 @@ def test_channel_write_redacted(caplog, monkeypatch, base_channel):
     assert logging.DEBUG == log_record.levelno
 
 
+def test_channel_write_debug_disabled(caplog, monkeypatch, base_channel):
+    caplog.set_level(logging.INFO, logger="scrapli.channel")
+
+    def _write(cls, channel_input, redacted: bool = False):
+        pass
+
+    monkeypatch.setattr("scrapli.transport.base.base_transport.BaseTransport.write", _write)
+
+    base_channel.write(channel_input="blah")
+
+    assert not caplog.records
+
+
 def test_channel_send_return(monkeypatch, base_channel):
     base_channel._base_channel_args.comms_return_char = "RETURNCHAR"
 
@@ -170,6 +246,13 @@ def test_channel_send_return(monkeypatch, base_channel):
     base_channel.send_return()
 
 
+def test_channel_get_comms_return_char_bytes(base_channel):
+    assert base_channel._get_comms_return_char_bytes() == b"\n"
+
+    base_channel._base_channel_args.comms_return_char = "\r\n"
+    assert base_channel._get_comms_return_char_bytes() == b"\r\n"
+
+
 @pytest.mark.parametrize(
     "test_data",
     (
@@ -222,6 +305,10 @@ def test_channel_send_return(monkeypatch, base_channel):
             # note: empty quotes in the middle is where private key filename would be
             "Permissions for private key are too open, authentication failed!",
         ),
+        (
+            b"warning: unprotected private key file!",
+            "Permissions for private key are too open, authentication failed!",
+        ),
         (
             b"Could not resolve hostname BLAH: No address associated with hostname",
             # note: empty quotes in the middle is where private key filename would be
@@ -245,6 +332,7 @@ def test_channel_send_return(monkeypatch, base_channel):
         "no matching cipher found ciphers",
         "bad configuration option",
         "unprotected key",
+        "unprotected key lowered",
         "could not resolve host",
         "bad permissions",
     ),
@@ -273,6 +361,30 @@ def test_get_prompt_pattern_provided_no_multiline(base_channel):
     assert actual_pattern == re.compile(b"some_pattern")
 
 
+def test_join_and_compile(base_channel):
+    actual_pattern = base_channel._join_and_compile(channel_outputs=[b"one", b"tw(o|0)"])
+    assert actual_pattern == re.compile(b"(?:one)|(?:tw(o|0))", flags=re.M | re.I)
+    assert actual_pattern.groups == 1
+    assert actual_pattern.search(b"blah TW0 blah")
+
+
+def test_join_and_compile_no_outputs(base_channel):
+    actual_pattern = base_channel._join_and_compile(channel_outputs=None)
+    assert actual_pattern == re.compile(b"", flags=re.M | re.I)
+
+
+def test_pre_read_until_explicit_prompt(base_channel):
+    base_channel._base_channel_args.comms_prompt_pattern = "^scrapli>$"
+    search_literals, search_patterns = base_channel._pre_read_until_explicit_prompt(
+        prompts=["Password:", "^provided_pattern$", ""]
+    )
+    assert search_literals == [b"Password:"]
+    assert search_patterns == [
+        re.compile(b"^provided_pattern$", flags=re.M | re.I),
+        re.compile(b"^scrapli>$", flags=re.M | re.I),
+    ]
+
+
 def test_process_output(base_channel):
     base_channel._base_channel_args.comms_prompt_pattern = "^scrapli>$"
     actual_processed_buf = base_channel._process_output(
@@ -281,6 +393,18 @@ def test_process_output(base_channel):
     assert actual_processed_buf == b"linewithtrailingspace\nsomethingelse"
 
 
+def test_process_output_multiple_prompts(base_channel):
+    base_channel._base_channel_args.comms_prompt_pattern = "^scrapli>$"
+    actual_processed_buf = base_channel._process_output(
+        buf=b"scrapli>\nsomething\nscrapli>\nsomethingelse", strip_prompt=True
+    )
+    assert actual_processed_buf == b"something\n\nsomethingelse"
+
+
+def test_process_output_empty(base_channel):
+    assert base_channel._process_output(buf=b"", strip_prompt=True) == b""
+
+
 @pytest.mark.parametrize(
     "buf, expected",
     (
@@ -300,6 +424,18 @@ def test_process_output(base_channel):
             b"\x1b[7mCTRL+C\x1b[0m \x1b[7mESC\x1b[0m \x1b[7mq\x1b[0m Quit \x1b[7mSPACE\x1b[0m \x1b[7mn\x1b[0m Next Page \x1b[7mENTER\x1b[0m Next Entry \x1b[7ma\x1b[0m All\x1b[1A\x1b[59C\x1b[27m",
             b"CTRL+C ESC q Quit SPACE n Next Page ENTER Next Entry a All",
         ),
+        (
+            b"\x1b[1mbold\x1b[0m and \x9b7meight bit csi\x9b0m",
+            b"bold and eight bit csi",
+        ),
+        (
+            b"\x1b]0;title\x07\x1b[1mtext\x1b[0m",
+            b"text",
+        ),
+        (
+            b"no escape sequences to see here",
+            b"no escape sequences to see here",
+        ),
     ),
 )
 def test_strip_ansi(base_channel, buf: bytes, expected: bytes):
@@ -316,6 +452,11 @@ def test_strip_ansi(base_channel, buf: bytes, expected: bytes):
     assert actual_strip_ansi_output == expected
 
 
+def test_squish_channel_input(base_channel):
+    actual_squished = base_channel._squish_channel_input(buf=b"Show  IP\x08 int\r\n brief\t")
+    assert actual_squished == b"showipintbrief"
+
+
 def test_pre_send_input_exception(base_channel):
     with pytest.raises(ScrapliTypeError):
         base_channel._pre_send_input(channel_input=None)
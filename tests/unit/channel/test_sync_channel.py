@@ -7,7 +7,7 @@ import pytest
 
 from scrapli.channel.base_channel import BaseChannelArgs
 from scrapli.channel.sync_channel import Channel
-from scrapli.exceptions import ScrapliAuthenticationFailed
+from scrapli.exceptions import ScrapliAuthenticationFailed, ScrapliConnectionError
 
 
 def test_channel_lock(base_transport_no_abc):
@@ -88,6 +88,19 @@ def test_channel_read_until_input(monkeypatch, sync_channel):
     assert actual_read_output == expected_read_output
 
 
+def test_channel_read_until_input_split_reads(monkeypatch, sync_channel):
+    reads = iter((b"read_data\nthis is ", b"MY\x08 in", b"put\n"))
+
+    def _read(cls):
+        return next(reads)
+
+    monkeypatch.setattr("scrapli.transport.base.sync_transport.Transport.read", _read)
+
+    actual_read_output = sync_channel._read_until_input(channel_input=b"thisismyinput")
+
+    assert actual_read_output == b"read_data\nthis is MY\x08 input\n"
+
+
 def test_channel_read_until_input_no_input(sync_channel):
     assert sync_channel._read_until_input(channel_input=b"") == b""
 
@@ -132,6 +145,21 @@ def test_channel_read_until_explicit_prompt(monkeypatch, sync_channel):
     assert actual_read_output == expected_read_output
 
 
+def test_channel_read_until_prompt_or_time_restores_timeout(monkeypatch, sync_channel):
+    def _read(cls):
+        raise ScrapliConnectionError
+
+    monkeypatch.setattr("scrapli.transport.base.sync_transport.Transport.read", _read)
+
+    transport_args = sync_channel.transport._base_transport_args
+    transport_args.timeout_transport = 30
+
+    with pytest.raises(ScrapliConnectionError):
+        sync_channel._read_until_prompt_or_time(read_duration=1)
+
+    assert transport_args.timeout_transport == 30
+
+
 # TODO read until prompt/time
 
 
@@ -352,6 +380,43 @@ def test_get_prompt(monkeypatch, sync_channel):
     assert sync_channel.get_prompt() == "scrapli>"
 
 
+def test_get_prompt_search_depth(monkeypatch, sync_channel):
+    # a prompt looking line outside of the search depth should not be matched
+    reads = iter((b"oldprompt#\n" + b"x" * 2000 + b"\n", b"scrapli>"))
+
+    def _read(cls):
+        return next(reads)
+
+    def _write(cls, channel_input):
+        pass
+
+    monkeypatch.setattr("scrapli.transport.base.sync_transport.Transport.read", _read)
+    monkeypatch.setattr("scrapli.transport.base.sync_transport.Transport.write", _write)
+
+    sync_channel._base_channel_args.comms_prompt_pattern = r"^\w+[#>]$"
+
+    assert sync_channel.get_prompt() == "scrapli>"
+
+
+def test_get_prompt_search_depth_unanchored(monkeypatch, sync_channel):
+    # the search depth cuts the first line short, that partial line must not match an unanchored
+    # prompt pattern
+    reads = iter((b"switchname#\n" + b"z" * 995, b"\nswitchname#"))
+
+    def _read(cls):
+        return next(reads)
+
+    def _write(cls, channel_input):
+        pass
+
+    monkeypatch.setattr("scrapli.transport.base.sync_transport.Transport.read", _read)
+    monkeypatch.setattr("scrapli.transport.base.sync_transport.Transport.write", _write)
+
+    sync_channel._base_channel_args.comms_prompt_pattern = r"[a-z]+#"
+
+    assert sync_channel.get_prompt() == "switchname#"
+
+
 def test_send_input(monkeypatch, sync_channel):
     _read_counter = 0
 